@@ -1,10 +1,18 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-import math
-import itertools
-import Bio.Seq
+import functools
+import types
 from importlib import resources
 
+_UP2BIT_LUT = bytes.maketrans(b"ACTG", b"\x00\x01\x02\x03")
+  # bytes.translate table mapping ASCII 'A', 'C', 'T', 'G' to their 2-bit
+  # values in `up2bit`; masking out ASCII bits 1-2 instead measured no faster
+_UP2BIT_DECODE_LUT = bytes.maketrans(b"\x00\x01\x02\x03", b"ACTG")
+  # inverse of _UP2BIT_LUT, mapping 2-bit values back to ASCII bases
+_SPLIT_BITS = 4000
+  # numbers of at least this many bits are split recursively in
+  # `digit_blocks`, below this a simple divmod loop is faster
+
 """
 
 Up to bit:
@@ -62,16 +70,33 @@ See: https://github.com/JohnLonginotto/ACGTrie/blob/master/docs/UP2BIT.md
 
 Args:
     dna_sequence: DNA sequence as an iterable of 'A', 'C', 'T', 'G' letters,
-        e.g. a string
+        e.g. a string, or as ASCII `bytes`/`bytearray` (e.g. read directly
+        from a sequence file), which are used without an intermediate copy.
 
 Returns:
     The `up2bit`-encoded DNA sequence as an arbitrary precision int.
 """
 def up2bit(dna_sequence):
-    result = 1
-    for char in reversed(dna_sequence):
-        twobit = ('A','C','T','G').index(char)
-        result = (result << 2) + twobit
+    if not isinstance(dna_sequence, (str, bytes, bytearray)):
+        dna_sequence = "".join(dna_sequence) # any other iterable of letters
+    if isinstance(dna_sequence, str):
+        try:
+            dna_sequence = dna_sequence.encode("ascii")
+        except UnicodeEncodeError:
+            bad = "".join(sorted(set(dna_sequence) - set("ACTG")))
+            raise ValueError(f"invalid bases {bad!r} in DNA sequence") from None
+    invalid = dna_sequence.translate(None, b"ACTG")
+    if invalid:
+        bad = "".join(sorted(set(invalid.decode("latin-1"))))
+        raise ValueError(f"invalid bases {bad!r} in DNA sequence")
+    twobits = dna_sequence.translate(_UP2BIT_LUT)
+    # Every 4th base (starting at an offset of 0-3) read as a little-endian
+    # int puts each base in its own byte, leaving room to shift it into its
+    # 2-bit slot within that byte; OR-ing the four offsets together packs 4
+    # bases per byte in up2bit order, with the first base least significant.
+    result = 1 << (2*len(twobits)) # cap
+    for offset in range(4):
+        result |= int.from_bytes(twobits[offset::4], "little") << (2*offset)
     return result
 
 """
@@ -86,23 +111,24 @@ Returns:
 """
 
 def up2bit_decode(up2bit_value):
-    result = []
+    if up2bit_value < 1:
+      raise Exception("expect positive up2bit encoding, with at least the cap bit")
     total_bits = up2bit_value.bit_length()
     if total_bits%2 != 1:
       raise Exception("expect odd number of bits in up2bit encoding")
-    mask = 0x03
-    remaining_bits = up2bit_value
-    twobit = None
-    while remaining_bits!=0:
-      twobit = remaining_bits&mask
-      char = ('A','C','T','G')[twobit]
-      remaining_bits = remaining_bits>>2
-      result.append(char)
-    if twobit!=1:
-      raise Exception(f"Expecting a cap of 0b01, but got {twobit}")
-      # odd number of bits check should prevent us getting here, but worth checking
-    result.pop() # pop cap
-    return "".join(result)
+      # with an odd number of bits, the most significant bit is the low bit
+      # of the top 2-bit field, so that field is always the cap 0b01
+    n_bases = total_bits//2 # all 2-bit fields below the cap
+    # Reverse of the packing in `up2bit`: masking the 2-bit slot at each
+    # offset 0-3 of every byte gives every 4th base, one per byte, which are
+    # interleaved back into sequence order; then cut off the cap and any
+    # padding beyond it.
+    n_bytes = (total_bits+7)//8
+    slot_mask = int.from_bytes(b"\x03"*n_bytes, "little")
+    twobits = bytearray(4*n_bytes)
+    for offset in range(4):
+        twobits[offset::4] = ((up2bit_value >> (2*offset)) & slot_mask).to_bytes(n_bytes, "little")
+    return twobits[:n_bases].translate(_UP2BIT_DECODE_LUT).decode("ascii")
 
 """
 Decode dice `123456`-style base6 numbers (e.g. `111111 = 0`, `111112 = 1`).
@@ -115,10 +141,12 @@ Returns:
 
 """
 def decode_dice(digits):
+  invalid = digits.strip("123456")
+  if invalid:
+    raise ValueError(f"invalid dice digit {invalid[0]!r}, expected 1-6")
   result = 0
-  for position, digit in enumerate(reversed(digits)):
-    hexit = ('1','2','3','4','5','6').index(digit)
-    result = result + hexit*(6**position)
+  for digit in digits:
+    result = result*6 + ord(digit) - 49 # ord('1') == 49, Horner's rule
   return result
 
 """
@@ -132,12 +160,14 @@ Args:
     file_handle: Handle of an open text file containing wordlist.
 
 Returns:
-    List of words, with lookup by index to give word for that index.
+    `Wordlist` of words, with lookup by index to give word for that index.
 
 """
 def read_wordlist(file_handle):
-  wordlist = []
-  for index, line in enumerate(file_handle):
+  lines = file_handle.read().splitlines()
+  wordlist = [None]*len(lines)
+    # one word per line, so a complete list has exactly as many indexes as lines
+  for index, line in enumerate(lines):
     line = line.strip()
     if "\t" in line:
       # expect Diceware-style two-column list with digits, word
@@ -148,25 +178,76 @@ def read_wordlist(file_handle):
       # otherwise expect simple flat list where row number is index
       word = line
       word_index = index
-    while len(wordlist)<=word_index:
-      wordlist.append(None)
+    if word_index>=len(wordlist):
+      raise Exception(f"index {word_index} out of range for list of {len(wordlist)} words")
     if wordlist[word_index] is not None:
       raise Exception(f"read multiple identical words for index {word_index}")
     wordlist[word_index] = word.lower()
-  # check all positions filed (i.e. no missing word for any index)
-  for index,word in enumerate(wordlist):
-    if word is None:
-      raise Exception(f"missing for index {index}")
+  # complete: one slot per line, each filled once by the range/duplicate checks
   # check size of word list = should be full range in base-6 or base-2
   total_words = len(wordlist)
+  if total_words < 2:
+    raise Exception(f"total words {total_words} is too few, at least 2 are needed to index words")
   if not is_full_base_x(total_words,2) and \
      not is_full_base_x(total_words,6) :
       raise Exception(f"total words {total_words} is not an full range in base-2 or base-6")
-  return wordlist
+  return Wordlist(wordlist)
 
 def generate_inverse_wordlist(wordlist):
     return {word : value for value, word in enumerate(wordlist)}
 
+"""
+Determines how values are split into blocks to index a wordlist of given
+length, i.e. whether the wordlist indexes are base-6 (hexal) or base-2,
+and how many digits in that base index each word. The value of a block
+of `blocksize` digits is always less than `wordlist_length`.
+
+Args:
+    wordlist_length: Number of words in wordlist.
+
+Returns:
+    Tuple of `is_hexal` (`True` if wordlist uses base6 indexes) and
+    `blocksize` (number of digits used to index each word in wordlist).
+
+"""
+def wordlist_blocks(wordlist_length):
+  is_hexal = is_full_base_x(wordlist_length,6)
+  if is_hexal:
+    blocksize = len(convert_base_x(wordlist_length, 6))-1 # exact floor(log6)
+  else:
+    blocksize = wordlist_length.bit_length()-1 # exact floor(log2)
+  return is_hexal, blocksize
+
+"""
+An immutable sequence of words (lookup by index gives word for that index)
+that also keeps the inverse lookup of word to index, the title case form of
+each word and the block parameters from `wordlist_blocks`, so that these are
+built once when the wordlist is read rather than for every mnemonic decoded
+or encoded. It is a tuple, with a read-only inverse mapping, as the cached
+`get_*_wordlist` loaders share one instance between all callers; copy it to
+a list to make a modified wordlist.
+
+A plain list of words is still accepted by `encode_sequence` and
+`decode_mnemonic`, but these are then recomputed on every call; wrap it
+once with `Wordlist(words)` when encoding or decoding many mnemonics.
+
+Args:
+    words: Iterable of words, in index order.
+
+Attributes:
+    inverse: Read-only mapping of word to index.
+    titled: Tuple of title case words, by index.
+    is_hexal: `True` if wordlist uses base6 indexes.
+    blocksize: Number of digits used to index each word in wordlist.
+
+"""
+class Wordlist(tuple):
+  # words are taken by tuple.__new__, so only the derived lookups are set here
+  def __init__(self, words):
+    self.inverse = types.MappingProxyType(generate_inverse_wordlist(self))
+    self.titled = tuple(word.title() for word in self)
+    self.is_hexal, self.blocksize = wordlist_blocks(len(self))
+
 """
 Determines if `number` starts with a '1' digit in the chosen `base`. A `True`
 return value might indicate, for example, that the integers from 0 to `number-1`
@@ -185,7 +266,17 @@ Returns:
 
 """
 def is_full_base_x(number, base):
-  return math.modf(math.log(number, base))[0]==0
+  # exact integer test for `number` being a power of `base`, unlike
+  # floating-point logs which can round either side of a whole number
+  if base < 2:
+    raise ValueError(f"invalid base {base}, expected at least 2")
+  if number < 1:
+    return False
+  if base == 2:
+    return number & (number-1) == 0
+  while number % base == 0:
+    number //= base
+  return number == 1
 
 """
 Converts a number to a list of digits in given base, with least signficiant
@@ -194,18 +285,171 @@ bits first e.g. 13 in base 2 to `[1, 0, 1, 1]`.
 Args:
     num: Number to convert.
     base: Number base to convert to.
+    min_digits: Pad with zeroes (at the most significant end) to at least
+        this many digits e.g. 13 in base 2 with 6 digits to
+        `[1, 0, 1, 1, 0, 0]`.
 
 Returns:
     Number in chosen base as list of digits (least significant first).
 
 """
-def convert_base_x(num, base):
-    result = []
-    while num:
-        num, digit = divmod(num, base)
-        result.append(digit)
+def convert_base_x(num, base, min_digits = 0):
+    if base & (base-1) == 0:
+      # power of 2 base: digits are fixed-size bit blocks, no division needed
+      result = list(bit_blocks(num, base.bit_length()-1))
+    else:
+      result = list(digit_blocks(num, base, 1))
+    if len(result) < min_digits:
+      result.extend([0]*(min_digits-len(result)))
     return result
 
+"""
+Splits a number into blocks of `blocksize` digits in given base, with least
+significant block first, e.g. 1000 in base 6 (`4344`) in blocks of 2 digits
+to `28, 27` (i.e. `44`, `43`).
+
+Each block is cut off with a single divmod by `base**blocksize`, rather than
+converting the whole number to a list of digits and regrouping these. Large
+numbers (see `_SPLIT_BITS`) are first split in halves by divmod with
+`base**(blocksize*2**k)`, recursively, so that most of the work is done on
+small numbers; repeatedly dividing the whole number instead takes time
+quadratic in its length.
+
+Args:
+    num: Number to split.
+    base: Number base of digits.
+    blocksize: Number of digits per block.
+
+Yields:
+    Value of each block as int (least significant first).
+
+"""
+def digit_blocks(num, base, blocksize):
+  block_modulus = base**blocksize
+  if block_modulus < 2:
+    raise ValueError(f"cannot split into blocks of {blocksize} digits in base {base}")
+  if num.bit_length() < _SPLIT_BITS:
+    while num:
+      num, block = divmod(num, block_modulus)
+      yield block
+    return
+
+  split_moduli = [block_modulus] # split_moduli[k] is block_modulus**(2**k)
+  while split_moduli[-1].bit_length()*2 <= num.bit_length():
+    split_moduli.append(split_moduli[-1]**2)
+  blocks = []
+  def split(num, k, pad):
+    # append blocks of num to `blocks`, padded with zeroes to 2**(k+1) blocks
+    # if `pad` (i.e. when num is the lower part of a split)
+    if k < 0 or num.bit_length() < _SPLIT_BITS:
+      start = len(blocks)
+      while num:
+        num, block = divmod(num, block_modulus)
+        blocks.append(block)
+      if pad:
+        blocks.extend([0]*((1 << (k+1)) - (len(blocks) - start)))
+      return
+    upper, lower = divmod(num, split_moduli[k])
+    if not upper and not pad:
+      split(lower, k-1, False)
+    else:
+      split(lower, k-1, True)
+      split(upper, k-1, pad)
+  split(num, len(split_moduli)-1, False)
+  yield from blocks
+
+"""
+Joins blocks of `blocksize` digits in given base, with least significant block
+first, back into a single number; the inverse of `digit_blocks`.
+
+Adjacent pairs of blocks are joined, then adjacent pairs of those pairs and so
+on, so that the large multiplications are few and balanced (which Python
+performs faster than quadratic time), rather than multiplying the whole number
+by `base**blocksize` for every block.
+
+Args:
+    blocks: Iterable of block values (least significant first), each less
+        than `base**blocksize`.
+    base: Number base of digits.
+    blocksize: Number of digits per block.
+
+Returns:
+    The joined number as int.
+
+"""
+def join_digit_blocks(blocks, base, blocksize):
+  blocks = list(blocks)
+  block_modulus = base**blocksize
+  while len(blocks) > 1:
+    if len(blocks)%2:
+      blocks.append(0)
+    blocks = [lower + upper*block_modulus for lower, upper in zip(blocks[0::2], blocks[1::2])]
+    block_modulus *= block_modulus
+  return blocks[0] if blocks else 0
+
+"""
+Splits a number into blocks of `blocksize` bits, with least significant
+block first e.g. `0b1011011` in blocks of 3 bits to `0b011, 0b011, 0b1`.
+
+The number is converted to bytes once and consumed through a small
+accumulator, rather than repeatedly masking and shifting the (arbitrary
+precision) number itself, which would copy it for every block.
+
+Args:
+    num: Number to split.
+    blocksize: Number of bits per block.
+
+Yields:
+    Value of each block as int (least significant first).
+
+"""
+def bit_blocks(num, blocksize):
+  mask = (1 << blocksize) - 1
+  remaining_blocks = -(-num.bit_length() // blocksize)
+  acc = 0
+  acc_bits = 0
+  for byte in num.to_bytes((num.bit_length() + 7) // 8, "little"):
+    acc |= byte << acc_bits
+    acc_bits += 8
+    while acc_bits >= blocksize and remaining_blocks:
+      yield acc & mask
+      acc >>= blocksize
+      acc_bits -= blocksize
+      remaining_blocks -= 1
+  if remaining_blocks:
+    yield acc
+
+"""
+Joins blocks of `blocksize` bits, with least significant block first, back
+into a single number; the inverse of `bit_blocks`.
+
+Blocks are packed through a small accumulator into bytes, which are
+converted to a number once at the end, rather than shifting each block
+into place in an (arbitrary precision) sum.
+
+Args:
+    blocks: Iterable of block values (least significant first), each less
+        than `2**blocksize`.
+    blocksize: Number of bits per block.
+
+Returns:
+    The joined number as int.
+
+"""
+def join_bit_blocks(blocks, blocksize):
+  packed = bytearray()
+  acc = 0
+  acc_bits = 0
+  for block in blocks:
+    acc |= block << acc_bits
+    acc_bits += blocksize
+    while acc_bits >= 8:
+      packed.append(acc & 0xFF)
+      acc >>= 8
+      acc_bits -= 8
+  packed.append(acc)
+  return int.from_bytes(packed, "little")
+
 """
 Format a list of digits in least to most significant digit order to
 a string with most significant bits to the left e.g. `[2, 1, 0, 3]` to `3012`.
@@ -223,11 +467,26 @@ Returns:
 """
 def str_digits(digits):
   get_char = lambda digit: str(digit) if digit<10 else chr(digit-10+ord("A")) 
-  return ''.join(get_char(digit) for digit in list(reversed(digits)))
+  return ''.join(get_char(digit) for digit in reversed(digits))
     # helper for printing list of digits with least-significant first as 
     # string with most significant to the left
 
+"""
+Encodes a DNA sequence as a mnemonic, by converting it to *up2bit* format and
+cutting the value into blocks (least significant first) that each index a
+word in `wordlist`.
+
+Args:
+    dna_sequence: DNA sequence, in any form accepted by `up2bit`.
+    wordlist: Sequence of words, e.g. as returned by `read_wordlist`.
+    verbose: If `True`, print each step of the encoding to stdout. All
+        diagnostic output is skipped (not just hidden) when `False`, so
+        this has no cost on the default path.
+
+Returns:
+    Mnemonic as a list of title case words.
 
+"""
 def encode_sequence(dna_sequence, wordlist, verbose = False):
   up2bit_value = up2bit(dna_sequence)
   if verbose: print(f"DNA sequence to encode: {dna_sequence}")
@@ -243,70 +502,87 @@ def encode_sequence(dna_sequence, wordlist, verbose = False):
   # to most significant (i.e. chunking is right-to-left), so first chunk 
   # will be left-most bases in original DNA sequence.
   mnemonic = []
-  is_hexal = is_full_base_x(len(wordlist),6) # True if wordlist uses base6 indexes
+  if isinstance(wordlist, Wordlist):
+    # reuse title case words and block parameters from when wordlist was read
+    titled_wordlist = wordlist.titled
+    is_hexal, blocksize = wordlist.is_hexal, wordlist.blocksize
+  else:
+    titled_wordlist = None
+    is_hexal, blocksize = wordlist_blocks(len(wordlist))
   if is_hexal:
     # encode as base6/hexal (using Diceware style wordlist)
-    hexal_blocksize = math.floor(math.log(len(wordlist), 6)) 
+    hexal_blocksize = blocksize
       # number of hexal digits used to index each word in wordlist
     
-    as_hexal = convert_base_x(up2bit_value, 6)
-      # note: this returns a list with least significant bits first
-      # we keep this as-is when processing, but reverse order of digits when printing
-
-    while len(as_hexal)%hexal_blocksize!=0:
-      as_hexal.append(0)
-      # append zeroes if needed
-
-    if verbose: print(f"wordlist hexal blocksize: {hexal_blocksize}\nhexal digits: {str_digits(as_hexal)}")
-    
-    hexal_blocks = (as_hexal[x:x+hexal_blocksize] for x in range(0, len(as_hexal), hexal_blocksize))
+    if verbose:
+      hexal_digits = convert_base_x(up2bit_value, 6)
+      hexal_digits.extend([0]*(-len(hexal_digits) % hexal_blocksize))
+        # pad with zeroes to whole blocks
+      print(f"wordlist hexal blocksize: {hexal_blocksize}\nhexal digits: {str_digits(hexal_digits)}")
 
-    for hexal_block in hexal_blocks:
-      index = sum(digit*(6**pos) for pos, digit in enumerate(hexal_block))
+    for index in digit_blocks(up2bit_value, 6, hexal_blocksize):
       word = wordlist[index]
-      mnemonic.append(word.title())
+      mnemonic.append(titled_wordlist[index] if titled_wordlist is not None else word.title())
       if verbose: 
+        hexal_block = convert_base_x(index, 6, hexal_blocksize)
         print(f" digits {str_digits(hexal_block)},"
               f" dice {str_digits(list(digit+1 for digit in hexal_block))},"
               f" index: {index}, word: {word}")
 
   else:
     # encode as binary (using bip39 style wordlist)
-    binary_blocksize = math.floor(math.log(len(wordlist), 2)) 
+    binary_blocksize = blocksize
 
-    mask = sum(1<<pos for pos in range(0, binary_blocksize))
     if verbose: print(f"wordlist binary blocksize: {binary_blocksize}")
 
-    # cut off chunks of bits using a bit shift
-    remaining_bits = up2bit_value
-    while remaining_bits!=0:
-      this_block = remaining_bits&mask
-      remaining_bits=remaining_bits>>binary_blocksize
+    # cut off chunks of bits from a single pass over the bytes of the value
+    for this_block in bit_blocks(up2bit_value, binary_blocksize):
       word = wordlist[this_block]
-      mnemonic.append(word.title())
+      mnemonic.append(titled_wordlist[this_block] if titled_wordlist is not None else word.title())
       if verbose: print(f" digits {this_block:0{binary_blocksize}b}, index: {this_block}, word: {word}")
   
   return mnemonic
 
+"""
+Decodes a mnemonic produced by `encode_sequence` back to a DNA sequence.
+
+Args:
+    mnemonic: Iterable of words (case insensitive).
+    wordlist: List of words used for encoding; not required if
+        `inverse_wordlist` is provided.
+    inverse_wordlist: Dict of word to index, as returned by
+        `generate_inverse_wordlist`.
+    verbose: If `True`, print each step of the decoding to stdout. All
+        diagnostic output is skipped when `False`.
+
+Returns:
+    dna_sequence: DNA sequence as a string of 'A', 'C', 'T', 'G' letters.
+
+"""
 def decode_mnemonic(mnemonic, wordlist = None, inverse_wordlist = None, verbose = False):
   # Decode a mnemonic DNA sequence encoded with up2bit encoding+wordlist 
   # back to sequence
 
   if inverse_wordlist is None:
-    wordlist_length = len(wordlist)
     if wordlist is None:
       raise Exception("Either wordlist or inverse wordlist must be provided")
-    inverse_wordlist = generate_inverse_wordlist(wordlist)
-    # Convert wordlist to dict for reverse lookup
+    if isinstance(wordlist, Wordlist):
+      inverse_wordlist = wordlist.inverse
+      is_hexal, blocksize = wordlist.is_hexal, wordlist.blocksize
+      # reuse reverse lookup and block parameters from when wordlist was read
+    else:
+      inverse_wordlist = generate_inverse_wordlist(wordlist)
+      # Convert wordlist to dict for reverse lookup
+      is_hexal, blocksize = wordlist_blocks(len(wordlist))
   else:
-    wordlist_length = len(inverse_wordlist)
-
-  mnemonic = list(word.lower() for word in mnemonic)
+    is_hexal, blocksize = wordlist_blocks(len(inverse_wordlist))
 
-  for word in mnemonic:
-    if word not in inverse_wordlist: raise Exception(f"Word {word} not in wordlist.")
+  mnemonic = list(map(str.lower, mnemonic))
 
-  values = [inverse_wordlist[word] for word in mnemonic]
+  try:
+    values = list(map(inverse_wordlist.__getitem__, mnemonic))
+  except KeyError as error:
+    raise Exception(f"Word {error.args[0]} not in wordlist.") from None
   # This is list of decoded values, note that the first values correspond to the
   # least significant digits of the corresponding up2bit encoded int (in turn 
   # these correspond to the left-most bases in the sequence).
@@ -314,71 +590,66 @@ def decode_mnemonic(mnemonic, wordlist = None, inverse_wordlist = None, verbose
   if verbose: 
     print(f"mnemonic to decode: {mnemonic}")
     print(f"decoded values: {values}")
-  is_hexal = is_full_base_x(wordlist_length,6) # True if wordlist uses base6 indexes
 
   if is_hexal:
-    hexal_blocksize = math.floor(math.log(wordlist_length, 6)) 
-    hexal_digit_blocks = [convert_base_x(value, 6) for value in values]
-      # convert each word into a series of hexal digits
-    
-    hexal_digit_blocks = list( hexal_digit_block + [0]*(hexal_blocksize-len(hexal_digit_block)) for
-      hexal_digit_block in hexal_digit_blocks)
-      # pad with zeroes to the right as needed, e.g. [2, 2] to [2, 2, 0, 0]
-    hexal_digits = list(itertools.chain(*hexal_digit_blocks))  
-      # flatten into a list of hexal digits
+    hexal_blocksize = blocksize
+    up2bit_value = join_digit_blocks(values, 6, hexal_blocksize)
+      # each value is a whole block of hexal digits, so blocks are joined
+      # directly without first splitting them into digits
 
-    up2bit_value = sum(hexal_digit*(6**pos) for pos, hexal_digit in enumerate(hexal_digits))
     if verbose:
+      hexal_digit_blocks = [convert_base_x(value, 6, hexal_blocksize) for value in values]
+        # convert each word into a series of hexal digits, padded with zeroes
+        # to the right as needed, e.g. [2, 2] to [2, 2, 0, 0]
+      hexal_digits = convert_base_x(up2bit_value, 6, hexal_blocksize*len(values))
+        # all hexal digits, as the flattened digit blocks (including padding)
       print("hexal digit blocks: " + 
           ", ".join(str_digits(hexal_digit_block) for hexal_digit_block in hexal_digit_blocks))
       print(f"hexal digits: {str_digits(hexal_digits)}")
 
   else:
-    binary_blocksize = math.floor(math.log(wordlist_length, 2)) 
-    up2bit_value = sum(value<<binary_blocksize*chunk for chunk, value in enumerate(values))
+    binary_blocksize = blocksize
+    up2bit_value = join_bit_blocks(values, binary_blocksize)
   if verbose: print(f"decoded up2bit value: {up2bit_value}, 0b{up2bit_value:b}")
   dna_sequence = up2bit_decode(up2bit_value)
   if verbose: print(f"DNA sequence {dna_sequence}")
   return dna_sequence
 
+@functools.lru_cache(maxsize=None)
 def get_bip39_english_wordlist():
   with resources.open_text("dna_mnemonic.wordlist","bip39_english.txt") as handle:
     return read_wordlist(handle)
-  return None
-  
+
+@functools.lru_cache(maxsize=None)
 def get_eff_large_wordlist():
   with resources.open_text("dna_mnemonic.wordlist","eff_large_wordlist.txt") as handle:
     return read_wordlist(handle)
-  return None
 
+@functools.lru_cache(maxsize=None)
 def get_eff_short_wordlist1():
   with resources.open_text("dna_mnemonic.wordlist","eff_short_wordlist_1.txt") as handle:
     return read_wordlist(handle)
-  return None
 
+@functools.lru_cache(maxsize=None)
 def get_eff_short_wordlist2():
   with resources.open_text("dna_mnemonic.wordlist","eff_short_wordlist_2_0.txt") as handle:
     return read_wordlist(handle)
-  return None
 
 if __name__ == "__main__":
+  # run as `python -m dna_mnemonic.dna_mnemonic` from the repository root; run
+  # as a script, this module shadows the package and the wordlists are not found
   test_sequences = ["TAGCCACACAGACTATTGTG",
                     "AAGCCACACAGACTATTGTG",
                     "TAGCCACACAGACTATTGTA"]
-  #bip39_english = read_wordlist("wordlist/bip39_english.txt")
-  #eff_large_wordlist = read_wordlist("wordlist/eff_large_wordlist.txt")
-  #eff_short_wordlist1 = read_wordlist("wordlist/eff_short_wordlist_1.txt")
-  #eff_short_wordlist2 = read_wordlist("wordlist/eff_short_wordlist_2_0.txt")
-  wordlists = ["bip39_english.txt", "eff_large_wordlist.txt",
-              "eff_short_wordlist_1.txt", "eff_short_wordlist_2_0.txt"]
+  wordlist_getters = [get_bip39_english_wordlist, get_eff_large_wordlist,
+                      get_eff_short_wordlist1, get_eff_short_wordlist2]
   verbose = False
-  for wordlist_name in wordlists:
-    wordlist = read_wordlist(open("wordlist/"+wordlist_name))
-    print(wordlist_name)
-    inverse_wordlist = generate_inverse_wordlist(open(wordlist))
+  for get_wordlist in wordlist_getters:
+    wordlist = get_wordlist()
+    print(get_wordlist.__name__)
     for dna_sequence in test_sequences:
       mnemonic = encode_sequence(dna_sequence, wordlist, verbose=verbose)
-      decoded = decode_mnemonic(mnemonic, inverse_wordlist = inverse_wordlist, verbose=verbose)
+      decoded = decode_mnemonic(mnemonic, wordlist, verbose=verbose)
       print("".join(mnemonic))
       print(decoded)
     print()
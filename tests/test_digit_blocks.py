@@ -0,0 +1,58 @@
+import random
+import unittest
+
+from dna_mnemonic.dna_mnemonic import _SPLIT_BITS, digit_blocks, join_digit_blocks
+
+
+def simple_digit_blocks(num, base, blocksize):
+  # reference: plain divmod loop, least significant block first
+  block_modulus = base**blocksize
+  blocks = []
+  while num:
+    num, block = divmod(num, block_modulus)
+    blocks.append(block)
+  return blocks
+
+
+class DigitBlocksTest(unittest.TestCase):
+  def check(self, num, base, blocksize):
+    blocks = list(digit_blocks(num, base, blocksize))
+    self.assertEqual(blocks, simple_digit_blocks(num, base, blocksize))
+    self.assertEqual(join_digit_blocks(blocks, base, blocksize), num)
+
+  def test_round_trip(self):
+    rng = random.Random(0)
+    for base, blocksize in ((6, 5), (6, 4), (2, 11)):
+      block_modulus = base**blocksize
+      for bits in (1, _SPLIT_BITS-1, _SPLIT_BITS, _SPLIT_BITS+1, 4*_SPLIT_BITS, 20*_SPLIT_BITS):
+        with self.subTest(base=base, blocksize=blocksize, bits=bits):
+          self.check(rng.getrandbits(bits) | (1 << (bits-1)), base, blocksize)
+      for power in (1, 2, 300, 301, 1024, 5000):
+        with self.subTest(base=base, blocksize=blocksize, power=power):
+          num = block_modulus**power
+          self.check(num, base, blocksize)
+          self.check(num-1, base, blocksize)
+          self.check(num+1, base, blocksize)
+
+  def test_large_blocksize(self):
+    # block moduli of thousands of bits, split down to single padded blocks
+    rng = random.Random(0)
+    for base, blocksize in ((2, 3000), (10, 700)):
+      block_modulus = base**blocksize
+      for bits in (5000, 9000, 40000):
+        with self.subTest(base=base, blocksize=blocksize, bits=bits):
+          self.check(rng.getrandbits(bits) | (1 << (bits-1)), base, blocksize)
+      for power in (1, 2, 7, 8):
+        with self.subTest(base=base, blocksize=blocksize, power=power):
+          num = block_modulus**power
+          self.check(num, base, blocksize)
+          self.check(num-1, base, blocksize)
+          self.check(num+1, base, blocksize)
+
+  def test_zero(self):
+    self.assertEqual(list(digit_blocks(0, 6, 5)), [])
+    self.assertEqual(join_digit_blocks([], 6, 5), 0)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,39 @@
+import itertools
+import random
+import unittest
+
+from dna_mnemonic.dna_mnemonic import (
+  decode_mnemonic, encode_sequence, get_bip39_english_wordlist,
+  get_eff_large_wordlist, get_eff_short_wordlist1, get_eff_short_wordlist2,
+  up2bit, up2bit_decode)
+
+
+class RoundTripTest(unittest.TestCase):
+  def test_up2bit(self):
+    # lengths 0-9 cross the byte boundary and every strided packing offset;
+    # all sequences up to 5 bases, then a random sample of longer ones
+    rng = random.Random(0)
+    for length in range(10):
+      if length <= 5:
+        dna_sequences = ["".join(bases) for bases in itertools.product("ACTG", repeat=length)]
+      else:
+        dna_sequences = ["".join(rng.choices("ACTG", k=length)) for _ in range(200)]
+      for dna_sequence in dna_sequences:
+        with self.subTest(dna_sequence=dna_sequence):
+          self.assertEqual(up2bit_decode(up2bit(dna_sequence)), dna_sequence)
+
+  def test_wordlists(self):
+    rng = random.Random(0)
+    dna_sequences = ["", "A", "G", "TAGCCACACAGACTATTGTG"]
+    dna_sequences += ["".join(rng.choices("ACTG", k=length)) for length in (7, 33, 500)]
+    for get_wordlist in (get_bip39_english_wordlist, get_eff_large_wordlist,
+                         get_eff_short_wordlist1, get_eff_short_wordlist2):
+      wordlist = get_wordlist()
+      for dna_sequence in dna_sequences:
+        with self.subTest(wordlist=get_wordlist.__name__, dna_sequence=dna_sequence):
+          mnemonic = encode_sequence(dna_sequence, wordlist)
+          self.assertEqual(decode_mnemonic(mnemonic, wordlist), dna_sequence)
+
+
+if __name__ == "__main__":
+  unittest.main()